@@ -0,0 +1,735 @@
+"""
+Convert dbt seeds to Parquet and generate the source definitions to read them.
+
+`dbt seed` loads CSV rows through the adapter in INSERT batches, which is slow and
+memory-hungry for large reference files. This tool streams each seed CSV into a Parquet
+file block by block (memory is bounded by the block and row group sizes, not the file
+size), applying the `column_types` declared in `dbt_project.yml` and seed property files.
+It then writes a sources YAML file with `external` table definitions in the format used by
+the `dbt-labs/dbt_external_tables` package, so the Parquet files can be staged with
+`dbt run-operation stage_external_sources` and selected with `source()`.
+
+Columns without a declared type are written as `string`, so the output schema never
+depends on which rows happen to be in the first block. Unlike `dbt seed`, no types are
+inferred, so declare `column_types` for every non-string column; `--strict` enforces it.
+Empty and `null` cells (in any case, ignoring surrounding whitespace) are written as NULL,
+as `dbt seed` loads them.
+
+The location must be a cloud storage URI under a Unity Catalog external location; tables
+cannot be registered on `/Volumes` paths.
+
+Usage
+-----
+    uv run python -m <package>.seed_to_parquet \
+        --location abfss://<container>@<account>.dfs.core.windows.net/seeds
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import re
+import sys
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from decimal import ROUND_HALF_UP, Context, Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import yaml
+
+DEFAULT_BLOCK_SIZE = 1 << 20  # bytes of CSV parsed per batch
+DEFAULT_ROW_GROUP_SIZE = 128_000  # maximum rows per Parquet row group
+DEFAULT_OUTPUT_DIR = "target/seeds_parquet"
+DEFAULT_SOURCES_FILE = "src/models/_seeds_sources.yml"
+DEFAULT_SOURCE_NAME = "seeds"
+PARQUET_FILE_NAME = "part-00000.parquet"
+NULL_VALUES = ("", "null")  # trimmed, lowercased cell values `dbt seed` loads as NULL
+
+# Seed configs recognised in `dbt_project.yml`; any other key is a folder or seed name.
+SEED_CONFIG_KEYS = frozenset(
+    {
+        "alias",
+        "column_types",
+        "database",
+        "delimiter",
+        "docs",
+        "enabled",
+        "full_refresh",
+        "grants",
+        "group",
+        "meta",
+        "persist_docs",
+        "post-hook",
+        "pre-hook",
+        "quote_columns",
+        "schema",
+        "tags",
+    }
+)
+
+_SIMPLE_TYPES: dict[str, pa.DataType] = {
+    "string": pa.string(),
+    "varchar": pa.string(),
+    "char": pa.string(),
+    "boolean": pa.bool_(),
+    "tinyint": pa.int8(),
+    "byte": pa.int8(),
+    "smallint": pa.int16(),
+    "short": pa.int16(),
+    "int": pa.int32(),
+    "integer": pa.int32(),
+    "bigint": pa.int64(),
+    "long": pa.int64(),
+    "float": pa.float32(),
+    "real": pa.float32(),
+    "double": pa.float64(),
+    "date": pa.date32(),
+    "timestamp": pa.timestamp("us", tz="UTC"),
+    "timestamp_ltz": pa.timestamp("us", tz="UTC"),
+    "timestamp_ntz": pa.timestamp("us"),
+}
+
+# Canonical Databricks SQL name for each Arrow type a seed column can be written as.
+_SQL_TYPES: dict[pa.DataType, str] = {
+    _SIMPLE_TYPES[name]: name
+    for name in (
+        "string",
+        "boolean",
+        "tinyint",
+        "smallint",
+        "int",
+        "bigint",
+        "float",
+        "double",
+        "date",
+        "timestamp",
+        "timestamp_ntz",
+    )
+}
+
+# Wide enough for any decimal(38,s) value; rounds like a Databricks decimal cast
+_DECIMAL_CONTEXT = Context(prec=80, rounding=ROUND_HALF_UP)
+
+_URI_PATTERN = re.compile(r"^[a-z][a-z0-9+.-]*://[^/]", re.IGNORECASE)
+
+_ZONE_OFFSET_PATTERN = r"(Z|[+-]\d{2}:?\d{2})$"
+
+_TYPE_PATTERN = re.compile(r"^\s*([a-z_]+)\s*(?:\(\s*([\d\s,]*)\))?\s*$")
+
+
+@dataclass(frozen=True)
+class Seed:
+    """
+    A seed CSV and the configuration that applies to it.
+
+    Attributes
+    ----------
+    name : str
+        Seed name (the CSV file stem).
+    path : Path
+        Path to the CSV file.
+    column_types : dict[str, str]
+        Declared Databricks SQL types keyed by column name.
+    delimiter : str
+        Field delimiter of the CSV file.
+    """
+
+    name: str
+    path: Path
+    column_types: dict[str, str] = field(default_factory=dict)
+    delimiter: str = ","
+
+
+@dataclass(frozen=True)
+class ConversionResult:
+    """
+    Outcome of converting one seed.
+
+    Attributes
+    ----------
+    seed : Seed
+        The converted seed.
+    parquet_path : Path
+        Path of the written Parquet file.
+    schema : pa.Schema
+        Arrow schema of the Parquet file.
+    num_rows : int
+        Number of data rows written.
+    """
+
+    seed: Seed
+    parquet_path: Path
+    schema: pa.Schema
+    num_rows: int
+
+
+def to_arrow_type(sql_type: str) -> pa.DataType:
+    """
+    Map a Databricks SQL type, as declared in `column_types`, to an Arrow type.
+
+    Parameters
+    ----------
+    sql_type : str
+        Type name, e.g. `bigint`, `decimal(18, 2)`, `varchar(10)`.
+
+    Returns
+    -------
+    pa.DataType
+        Equivalent Arrow type.
+
+    Raises
+    ------
+    ValueError
+        If the type is not supported.
+    """
+    match = _TYPE_PATTERN.match(sql_type.lower())
+    if match is None:
+        raise ValueError(f"Unsupported seed column type: {sql_type!r}")
+    name, args = match.groups()
+    if name in {"decimal", "dec", "numeric"}:
+        params = [int(a) for a in (args or "").split(",") if a.strip()]
+        precision = params[0] if params else 10
+        scale = params[1] if len(params) > 1 else 0
+        return pa.decimal128(precision, scale)
+    if name in _SIMPLE_TYPES:
+        return _SIMPLE_TYPES[name]
+    raise ValueError(f"Unsupported seed column type: {sql_type!r}")
+
+
+def to_sql_type(arrow_type: pa.DataType) -> str:
+    """
+    Map an Arrow type produced by `to_arrow_type` back to a Databricks SQL type.
+
+    Parameters
+    ----------
+    arrow_type : pa.DataType
+        Arrow type of a Parquet column.
+
+    Returns
+    -------
+    str
+        Databricks SQL type name.
+    """
+    if pa.types.is_decimal(arrow_type):
+        return f"decimal({arrow_type.precision},{arrow_type.scale})"
+    if arrow_type in _SQL_TYPES:
+        return _SQL_TYPES[arrow_type]
+    raise ValueError(f"Unsupported Arrow type: {arrow_type}")
+
+
+def _load_yaml(path: Path) -> Any:
+    with path.open("r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def _split_config(node: Mapping[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Split a `dbt_project.yml` seeds node into its configs and its children."""
+    configs: dict[str, Any] = {}
+    children: dict[str, Any] = {}
+    for key, value in node.items():
+        name = key.removeprefix("+")
+        if key.startswith("+") or name in SEED_CONFIG_KEYS:
+            configs[name] = value
+        elif isinstance(value, Mapping):
+            children[key] = value
+    return configs, children
+
+
+def _merge_config(base: dict[str, Any], update: Mapping[str, Any]) -> dict[str, Any]:
+    """Merge seed configs the way dbt does: `column_types` is updated, others replaced."""
+    merged = dict(base)
+    for key, value in update.items():
+        if key == "column_types" and isinstance(value, Mapping):
+            merged["column_types"] = {**merged.get("column_types", {}), **value}
+        else:
+            merged[key] = value
+    return merged
+
+
+def _project_config(
+    seeds_node: Mapping[str, Any], project_name: str, parts: Sequence[str]
+) -> dict[str, Any]:
+    """Resolve the `dbt_project.yml` config for a seed at the given relative path parts."""
+    configs, children = _split_config(seeds_node)
+    resolved = _merge_config({}, configs)
+    node = children.get(project_name)
+    for part in parts:
+        if not isinstance(node, Mapping):
+            break
+        configs, children = _split_config(node)
+        resolved = _merge_config(resolved, configs)
+        node = children.get(part)
+    if isinstance(node, Mapping):
+        configs, _ = _split_config(node)
+        resolved = _merge_config(resolved, configs)
+    return resolved
+
+
+def _property_configs(seed_dirs: Sequence[Path]) -> dict[str, dict[str, Any]]:
+    """Collect `config` blocks declared for seeds in property files under the seed paths."""
+    configs: dict[str, dict[str, Any]] = {}
+    for seed_dir in seed_dirs:
+        for path in sorted([*seed_dir.rglob("*.yml"), *seed_dir.rglob("*.yaml")]):
+            data = _load_yaml(path) or {}
+            for entry in data.get("seeds") or []:
+                if isinstance(entry, Mapping) and "name" in entry:
+                    configs[entry["name"]] = dict(entry.get("config") or {})
+    return configs
+
+
+def discover_seeds(
+    project_dir: Path, select: Sequence[str] | None = None
+) -> list[Seed]:
+    """
+    Find the seeds of a dbt project and resolve their configuration.
+
+    Configuration is taken from the `seeds` block of `dbt_project.yml` and then from
+    `config` blocks in property files under the seed paths, which take precedence.
+    Disabled seeds are included: converted seeds are disabled so `dbt seed` skips them,
+    and re-running the tool must still convert them.
+
+    Parameters
+    ----------
+    project_dir : Path
+        Directory containing `dbt_project.yml`.
+    select : Sequence[str] | None
+        Seed names to include; all seeds when `None`.
+
+    Returns
+    -------
+    list[Seed]
+        Seeds sorted by name.
+    """
+    project = _load_yaml(project_dir / "dbt_project.yml") or {}
+    project_name = project["name"]
+    seeds_node = project.get("seeds") or {}
+    seed_dirs = [project_dir / p for p in project.get("seed-paths") or ["seeds"]]
+    property_configs = _property_configs(seed_dirs)
+
+    seeds: list[Seed] = []
+    for seed_dir in seed_dirs:
+        for path in sorted(seed_dir.rglob("*.csv")):
+            name = path.stem
+            if select is not None and name not in select:
+                continue
+            parts = [*path.relative_to(seed_dir).parent.parts, name]
+            config = _project_config(seeds_node, project_name, parts)
+            config = _merge_config(config, property_configs.get(name, {}))
+            seeds.append(
+                Seed(
+                    name=name,
+                    path=path,
+                    column_types=dict(config.get("column_types") or {}),
+                    delimiter=config.get("delimiter") or ",",
+                )
+            )
+    return sorted(seeds, key=lambda s: s.name)
+
+
+def _read_header(seed: Seed) -> list[str]:
+    with seed.path.open("r", encoding="utf-8-sig", newline="") as f:
+        return next(csv.reader(f, delimiter=seed.delimiter), [])
+
+
+def seed_schema(seed: Seed, strict: bool = False) -> pa.Schema:
+    """
+    Build the Arrow schema for a seed from its header and declared `column_types`.
+
+    Parameters
+    ----------
+    seed : Seed
+        Seed to describe.
+    strict : bool
+        Fail instead of defaulting undeclared columns to `string`.
+
+    Returns
+    -------
+    pa.Schema
+        Schema with declared columns typed and all others as `string`.
+
+    Raises
+    ------
+    ValueError
+        If `column_types` names a column that is not in the CSV header, or, when
+        `strict`, if a column has no declared type.
+    """
+    header = _read_header(seed)
+    if not header:
+        raise ValueError(f"Seed {seed.name!r} has no header row: {seed.path}")
+    declared = {k.lower(): v for k, v in seed.column_types.items()}
+    unknown = set(declared) - {c.lower() for c in header}
+    if unknown:
+        raise ValueError(
+            f"Seed {seed.name!r} declares column_types for unknown columns: {sorted(unknown)}"
+        )
+    undeclared = [c for c in header if c.lower() not in declared]
+    if strict and undeclared:
+        raise ValueError(
+            f"Seed {seed.name!r} has no column_types for columns: {undeclared}; "
+            "declare every column (use `string` for text) or drop --strict"
+        )
+    return pa.schema(
+        [pa.field(c, to_arrow_type(declared.get(c.lower(), "string"))) for c in header]
+    )
+
+
+def _null_mask(column: pa.Array) -> pa.Array:
+    """Cells `dbt seed` loads as NULL: `NULL_VALUES` after trimming and lowercasing."""
+    normalised = pc.utf8_lower(pc.utf8_trim_whitespace(column))
+    return pc.fill_null(pc.is_in(normalised, value_set=pa.array(NULL_VALUES)), True)
+
+
+def _round_decimals(text: pa.Array, arrow_type: pa.Decimal128Type) -> pa.Array:
+    """Round decimal text half away from zero to the scale of `arrow_type`."""
+    quantum = Decimal(1).scaleb(-arrow_type.scale)
+    values = []
+    for value in text.to_pylist():
+        if value is None:
+            values.append(None)
+            continue
+        try:
+            values.append(Decimal(value).quantize(quantum, context=_DECIMAL_CONTEXT))
+        except InvalidOperation as e:
+            raise pa.ArrowInvalid(f"invalid decimal value {value!r}") from e
+    return pa.array(values, type=arrow_type)
+
+
+def _convert_column(column: pa.Array, arrow_type: pa.DataType) -> pa.Array:
+    """
+    Convert a text column to its declared type the way `dbt seed` and the warehouse would.
+
+    - NULL cells (see `_null_mask`) become NULL in every column; strings keep their other
+      values verbatim, while typed values are trimmed before conversion.
+    - Booleans are matched case-insensitively.
+    - Zoned timestamps: values with a zone offset are converted to UTC; values without
+      one are taken as UTC wall-clock time.
+    - Decimals: values are rounded half away from zero to the declared scale, as a cast
+      to `decimal(p,s)` does in Databricks, rather than rejected.
+    """
+    no_value = pa.scalar(None, pa.string())
+    is_null = _null_mask(column)
+    if pa.types.is_string(arrow_type):
+        return pc.if_else(is_null, no_value, column)
+    text = pc.if_else(is_null, no_value, pc.utf8_trim_whitespace(column))
+    if pa.types.is_boolean(arrow_type):
+        return pc.utf8_lower(text).cast(arrow_type)
+    if pa.types.is_timestamp(arrow_type) and arrow_type.tz is not None:
+        has_offset = pc.fill_null(
+            pc.match_substring_regex(text, _ZONE_OFFSET_PATTERN), False
+        )
+        zoned = pc.if_else(has_offset, text, no_value).cast(arrow_type)
+        naive = pc.if_else(has_offset, no_value, text).cast(
+            pa.timestamp(arrow_type.unit)
+        )
+        return pc.coalesce(zoned, naive.cast(arrow_type))
+    if pa.types.is_decimal(arrow_type):
+        try:
+            return text.cast(arrow_type)
+        except pa.ArrowInvalid:
+            # Some values have more fractional digits than the scale; round them exactly
+            return _round_decimals(text, arrow_type)
+    return text.cast(arrow_type)
+
+
+def iter_batches(
+    seed: Seed, schema: pa.Schema, block_size: int = DEFAULT_BLOCK_SIZE
+) -> Iterator[pa.RecordBatch]:
+    """
+    Stream a seed CSV as record batches of roughly `block_size` bytes each.
+
+    Every column is parsed as text and then converted by `_convert_column`, so NULL
+    detection and type conversion follow `dbt seed` rather than the CSV parser.
+
+    Parameters
+    ----------
+    seed : Seed
+        Seed to read.
+    schema : pa.Schema
+        Target schema, typically from `seed_schema`.
+    block_size : int
+        Number of CSV bytes parsed per batch.
+
+    Yields
+    ------
+    pa.RecordBatch
+        Batches conforming to `schema`.
+
+    Raises
+    ------
+    ValueError
+        If a value cannot be converted to its column's type; the message names the
+        seed and, where known, the column.
+    """
+    try:
+        yield from _read_batches(seed, schema, block_size)
+    except pa.ArrowInvalid as e:
+        raise ValueError(f"Seed {seed.name!r}: {e}") from e
+
+
+def _read_batches(
+    seed: Seed, schema: pa.Schema, block_size: int
+) -> Iterator[pa.RecordBatch]:
+    reader = pa_csv.open_csv(
+        seed.path,
+        read_options=pa_csv.ReadOptions(
+            block_size=block_size, skip_rows=1, column_names=schema.names
+        ),
+        # Quoted values may span lines; without this the parser loses sync with the
+        # chunker as soon as such a value straddles a block boundary.
+        parse_options=pa_csv.ParseOptions(
+            delimiter=seed.delimiter, newlines_in_values=True
+        ),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in schema.names},
+            strings_can_be_null=False,
+        ),
+    )
+    for batch in reader:
+        columns = []
+        for column, f in zip(batch.columns, schema):
+            try:
+                columns.append(_convert_column(column, f.type))
+            except pa.ArrowInvalid as e:
+                raise ValueError(
+                    f"Seed {seed.name!r} column {f.name!r} has values that do not "
+                    f"fit {to_sql_type(f.type)}: {e}"
+                ) from e
+        yield pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def convert_seed(
+    seed: Seed,
+    output_dir: Path,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    strict: bool = False,
+) -> ConversionResult:
+    """
+    Convert one seed to `<output_dir>/<seed name>/part-00000.parquet`.
+
+    Batches are buffered until `row_group_size` rows are held, then flushed as Parquet
+    row groups of exactly `row_group_size` rows; only the final row group is smaller.
+    At most one row group plus one batch is held in memory. The file is written under a
+    temporary name and moved into place once complete, so a failed conversion never
+    leaves a truncated file behind.
+
+    Parameters
+    ----------
+    seed : Seed
+        Seed to convert.
+    output_dir : Path
+        Root directory for the Parquet output.
+    block_size : int
+        Number of CSV bytes parsed per batch.
+    row_group_size : int
+        Maximum number of rows per Parquet row group.
+    strict : bool
+        Fail if a column has no declared type; see `seed_schema`.
+
+    Returns
+    -------
+    ConversionResult
+        Written path, schema, and row count.
+    """
+    schema = seed_schema(seed, strict)
+    target = output_dir / seed.name / PARQUET_FILE_NAME
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.with_suffix(".parquet.tmp")
+
+    num_rows = 0
+    pending: list[pa.RecordBatch] = []
+    pending_rows = 0
+    try:
+        with pq.ParquetWriter(staging, schema, compression="zstd") as writer:
+            for batch in iter_batches(seed, schema, block_size):
+                pending.append(batch)
+                pending_rows += batch.num_rows
+                if pending_rows < row_group_size:
+                    continue
+                # Flush whole row groups; the remainder stays buffered for the next one
+                table = pa.Table.from_batches(pending, schema)
+                full_rows = pending_rows - pending_rows % row_group_size
+                writer.write_table(
+                    table.slice(0, full_rows), row_group_size=row_group_size
+                )
+                num_rows += full_rows
+                pending = table.slice(full_rows).to_batches()
+                pending_rows -= full_rows
+            if pending_rows or not num_rows:
+                writer.write_table(pa.Table.from_batches(pending, schema))
+                num_rows += pending_rows
+        os.replace(staging, target)
+    finally:
+        staging.unlink(missing_ok=True)
+
+    return ConversionResult(
+        seed=seed, parquet_path=target, schema=schema, num_rows=num_rows
+    )
+
+
+def sources_definition(
+    results: Sequence[ConversionResult],
+    location: str,
+    source_name: str = DEFAULT_SOURCE_NAME,
+) -> dict[str, Any]:
+    """
+    Build a dbt sources definition with external tables over the converted seeds.
+
+    The `external` blocks follow the `dbt-labs/dbt_external_tables` format for
+    Databricks (`location` and `using`).
+
+    Parameters
+    ----------
+    results : Sequence[ConversionResult]
+        Converted seeds.
+    location : str
+        Cloud storage URI the `<output_dir>` contents are uploaded to.
+    source_name : str
+        Name of the dbt source.
+
+    Returns
+    -------
+    dict[str, Any]
+        Content of a `version: 2` sources YAML file.
+    """
+    base = location.rstrip("/")
+    tables = [
+        {
+            "name": r.seed.name,
+            "external": {"location": f"{base}/{r.seed.name}", "using": "parquet"},
+            "columns": [
+                {"name": f.name, "data_type": to_sql_type(f.type)} for f in r.schema
+            ],
+        }
+        for r in results
+    ]
+    return {
+        "version": 2,
+        "sources": [
+            {"name": source_name, "schema": "{{ target.schema }}", "tables": tables}
+        ],
+    }
+
+
+def merge_sources(
+    existing: Mapping[str, Any], definition: Mapping[str, Any]
+) -> dict[str, Any]:
+    """
+    Merge a sources definition into a previously generated one.
+
+    Tables in `definition` replace tables of the same name in the matching source;
+    all other tables and sources in `existing` are kept.
+
+    Parameters
+    ----------
+    existing : Mapping[str, Any]
+        Content of the current sources YAML file.
+    definition : Mapping[str, Any]
+        Content built by `sources_definition` for the seeds just converted.
+
+    Returns
+    -------
+    dict[str, Any]
+        Merged content of a `version: 2` sources YAML file.
+    """
+    sources = [dict(s) for s in existing.get("sources") or []]
+    for new_source in definition["sources"]:
+        current = next((s for s in sources if s["name"] == new_source["name"]), None)
+        if current is None:
+            sources.append(dict(new_source))
+            continue
+        tables = {t["name"]: t for t in current.get("tables") or []}
+        tables.update({t["name"]: t for t in new_source["tables"]})
+        current["tables"] = [tables[name] for name in sorted(tables)]
+    return {**existing, "version": 2, "sources": sources}
+
+
+def write_sources(path: Path, definition: Mapping[str, Any]) -> None:
+    """Write a sources definition as YAML, marked as generated."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        f.write(
+            "# Generated by seed_to_parquet; re-run the tool rather than editing.\n"
+        )
+        yaml.safe_dump(dict(definition), f, sort_keys=False)
+
+
+def _location(value: str) -> str:
+    """Validate `--location` as a cloud storage URI external tables can be registered on."""
+    if not _URI_PATTERN.match(value):
+        raise argparse.ArgumentTypeError(
+            f"{value!r} is not a cloud storage URI (e.g. abfss://...); Unity Catalog "
+            "does not allow tables on local or /Volumes paths"
+        )
+    return value
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Stream dbt seeds to Parquet and generate external source definitions."
+    )
+    parser.add_argument("--project-dir", type=Path, default=Path("."))
+    parser.add_argument("--output-dir", type=Path, default=Path(DEFAULT_OUTPUT_DIR))
+    parser.add_argument(
+        "--location",
+        type=_location,
+        required=True,
+        help="Cloud storage URI the output directory is uploaded to.",
+    )
+    parser.add_argument("--sources-file", type=Path, default=Path(DEFAULT_SOURCES_FILE))
+    parser.add_argument("--source-name", default=DEFAULT_SOURCE_NAME)
+    parser.add_argument(
+        "--select",
+        nargs="+",
+        help="Seed names to convert; their tables are merged into the sources file.",
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Fail when a seed column has no declared column_types entry.",
+    )
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE)
+    parser.add_argument("--row-group-size", type=int, default=DEFAULT_ROW_GROUP_SIZE)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface."""
+    args = _parse_args(argv)
+    project_dir: Path = args.project_dir
+    output_dir = project_dir / args.output_dir
+    seeds = discover_seeds(project_dir, args.select)
+    if not seeds:
+        print("No seeds found.", file=sys.stderr)
+        return 1
+
+    results = []
+    for seed in seeds:
+        try:
+            result = convert_seed(
+                seed, output_dir, args.block_size, args.row_group_size, args.strict
+            )
+        except ValueError as e:
+            print(f"{seed.name}: {e}", file=sys.stderr)
+            return 1
+        print(f"{seed.name}: {result.num_rows} rows -> {result.parquet_path}")
+        results.append(result)
+
+    sources_file = project_dir / args.sources_file
+    definition = sources_definition(results, args.location, args.source_name)
+    # A partial run must not drop the tables of seeds it did not convert
+    if args.select and sources_file.exists():
+        definition = merge_sources(_load_yaml(sources_file) or {}, definition)
+    write_sources(sources_file, definition)
+    print(f"Sources written to {sources_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,22 +11,30 @@ from typing import Any, Callable, Literal, Optional, Protocol, TypedDict
 PKGS: dict[str, str] = {
     "ARTIFACTS": "brooklyn-data/dbt_artifacts",
     "AUTOMATE_DV": "Datavault-UK/automate_dv",
+    "EXTERNAL_TABLES": "dbt-labs/dbt_external_tables",
     "UTILS": "dbt-labs/dbt_utils",
     "EXPECTATIONS": "metaplane/dbt_expectations",
 }
 
 # Constrain the valid keys at type-check time
-PkgKey = Literal["ARTIFACTS", "AUTOMATE_DV", "UTILS", "EXPECTATIONS"]
+PkgKey = Literal["ARTIFACTS", "AUTOMATE_DV", "EXTERNAL_TABLES", "UTILS", "EXPECTATIONS"]
 
 # Version ranges centralised and keyed by PKGS keys (not raw strings)
 PKG_VERSIONS: dict[PkgKey, tuple[str, str]] = {
     "ARTIFACTS": (">=2.10.0", "<2.11.0"),
     "AUTOMATE_DV": (">=0.11.4", "<0.12.0"),
+    "EXTERNAL_TABLES": (">=0.11.0", "<0.12.0"),
     "UTILS": (">=1.3.3", "<1.4.0"),
     "EXPECTATIONS": (">=0.10.10", "<0.11.0"),
 }
 
-PKG_ORDER: list[PkgKey] = ["ARTIFACTS", "AUTOMATE_DV", "UTILS", "EXPECTATIONS"]
+PKG_ORDER: list[PkgKey] = [
+    "ARTIFACTS",
+    "AUTOMATE_DV",
+    "EXTERNAL_TABLES",
+    "UTILS",
+    "EXPECTATIONS",
+]
 
 
 # ---------------- small utilities ----------------
@@ -80,6 +88,7 @@ def _expected_packages(
     with_utils: bool,
     with_artifacts: bool,
     with_expectations: bool,
+    with_external_tables: bool,
     with_automate_dv: bool,
 ) -> Optional[list[PackageSpec]]:
     """
@@ -97,6 +106,8 @@ def _expected_packages(
         Whether dbt-artifacts should be included.
     with_expectations : bool
         Whether dbt-expectations should be included.
+    with_external_tables : bool
+        Whether dbt-external-tables should be included.
     with_automate_dv : bool
         Whether automate_dv should be included.
 
@@ -112,6 +123,8 @@ def _expected_packages(
         include_keys.append("ARTIFACTS")
     if with_automate_dv:
         include_keys.append("AUTOMATE_DV")
+    if with_external_tables:
+        include_keys.append("EXTERNAL_TABLES")
     if with_utils:
         include_keys.append("UTILS")
     if with_expectations:
@@ -189,6 +202,7 @@ class AnswersSpec(TypedDict):
     with_dbt_utils: bool
     with_dbt_artifacts: bool
     with_dbt_expectations: bool
+    with_dbt_external_tables: bool
     with_automate_dv: bool
 
 
@@ -247,7 +261,7 @@ def assert_answers() -> Callable[[CopierResult], None]:
     -------------------------------------
     result : CopierResult
         Copier result containing an `answers` mapping.
-    with_utils, with_artifacts, with_expectations, with_automate_dv : bool
+    with_utils, with_artifacts, with_expectations, with_external_tables, with_automate_dv : bool
         Scenario flags the answers must agree with.
     """
 
@@ -257,6 +271,7 @@ def assert_answers() -> Callable[[CopierResult], None]:
         with_utils: bool,
         with_artifacts: bool,
         with_expectations: bool,
+        with_external_tables: bool,
         with_automate_dv: bool,
     ) -> None:
         ans = result.answers
@@ -269,6 +284,7 @@ def assert_answers() -> Callable[[CopierResult], None]:
         assert bool(ans["with_dbt_utils"]) is bool(with_utils)
         assert bool(ans["with_dbt_artifacts"]) is bool(with_artifacts)
         assert bool(ans["with_dbt_expectations"]) is bool(with_expectations)
+        assert bool(ans["with_dbt_external_tables"]) is bool(with_external_tables)
         assert bool(ans["with_automate_dv"]) is bool(with_automate_dv)
 
     return _assert
@@ -302,6 +318,7 @@ def assert_packages_yaml() -> Callable[[Path], None]:
         with_utils: bool,
         with_artifacts: bool,
         with_expectations: bool,
+        with_external_tables: bool,
         with_automate_dv: bool,
     ) -> None:
         data_raw = _load_yaml(project_dir / "packages.yml")
@@ -310,6 +327,7 @@ def assert_packages_yaml() -> Callable[[Path], None]:
             with_utils=with_utils,
             with_artifacts=with_artifacts,
             with_expectations=with_expectations,
+            with_external_tables=with_external_tables,
             with_automate_dv=with_automate_dv,
         )
 
@@ -482,10 +500,15 @@ def assert_model_folders() -> Callable[[Path], None]:
 
 @pytest.fixture(
     params=[
-        ("defaults", {}, True, True, False, False),
+        ("defaults", {}, True, True, False, False, False),
         (
             "all_true",
-            {"with_dbt_expectations": True, "with_automate_dv": True},
+            {
+                "with_dbt_expectations": True,
+                "with_dbt_external_tables": True,
+                "with_automate_dv": True,
+            },
+            True,
             True,
             True,
             True,
@@ -498,6 +521,7 @@ def assert_model_folders() -> Callable[[Path], None]:
             False,
             False,
             False,
+            False,
         ),
         (
             "inverse_options",
@@ -505,12 +529,14 @@ def assert_model_folders() -> Callable[[Path], None]:
                 "with_dbt_utils": False,
                 "with_dbt_artifacts": False,
                 "with_dbt_expectations": True,
+                "with_dbt_external_tables": True,
                 "with_automate_dv": True,
             },
             False,
             False,
             True,
             True,
+            True,
         ),
     ],
     ids=lambda p: p[0] if isinstance(p, tuple) else str(p),
@@ -522,7 +548,8 @@ def template_scenario(request):
     Yields
     ------
     tuple
-        (name, extra_answers, with_utils, with_artifacts, with_expectations, with_automate_dv)
+        (name, extra_answers, with_utils, with_artifacts, with_expectations,
+        with_external_tables, with_automate_dv)
 
     Notes
     -----
@@ -0,0 +1,354 @@
+# tests/test_seed_to_parquet.py
+from __future__ import annotations
+
+import csv
+import datetime as dt
+import hashlib
+import importlib.util
+import sys
+from collections.abc import Iterable
+from decimal import Decimal
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+import yaml
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+ROW_COUNT = 5_000
+
+LOCATION = "abfss://seeds@devdbt.dfs.core.windows.net/default"
+
+# Spellings of NULL that `dbt seed` recognises, cycled through the nullable columns
+NULL_CELLS = ("", "NULL", "Null", " null ")
+
+COLUMN_TYPES = {
+    "id": "bigint",
+    "amount": "decimal(12,2)",
+    "ratio": "double",
+    "is_active": "boolean",
+    "valid_from": "date",
+}
+
+
+def _load_tool(project_dir: Path, monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Import `seed_to_parquet` from the generated project without installing it."""
+    path = project_dir / "src" / "dbt_project" / "seed_to_parquet.py"
+    assert path.exists(), f"Expected file not found: {path}"
+    spec = importlib.util.spec_from_file_location("seed_to_parquet", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # dataclasses resolve annotations through sys.modules while the module executes
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _write_seed(path: Path, delimiter: str) -> None:
+    """Write a seed CSV whose values are already in canonical text form."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, delimiter=delimiter)
+        writer.writerow(["id", "code", "amount", "ratio", "is_active", "valid_from"])
+        for i in range(ROW_COUNT):
+            writer.writerow(
+                [
+                    i,
+                    f"C{i:05d}" if i % 7 else NULL_CELLS[i % len(NULL_CELLS)],
+                    f"{i}.{i % 100:02d}",
+                    NULL_CELLS[i % len(NULL_CELLS)] if i % 11 == 0 else repr(i / 8),
+                    "true" if i % 2 else "false",
+                    (dt.date(2024, 1, 1) + dt.timedelta(days=i % 365)).isoformat(),
+                ]
+            )
+
+
+NULL = "\\N"  # checksum token for NULL, distinct from an empty string
+
+
+def _csv_text(value: str) -> str:
+    """Render a seed CSV cell the way `dbt seed` loads it: empty and `null` are NULL."""
+    return NULL if value.strip().lower() in {"", "null"} else value
+
+
+def _as_text(value: Any) -> str:
+    """Render a Parquet value the way it was written to the seed CSV."""
+    if value is None:
+        return NULL
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+def _checksum(rows: Iterable[Iterable[str]]) -> str:
+    digest = hashlib.sha256()
+    for row in rows:
+        digest.update("\x1f".join(row).encode("utf-8"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+def test_seed_round_trip(copie, assert_generation_ok, monkeypatch):
+    """
+    GIVEN a generated project with a seed larger than one CSV block
+    WHEN `seed_to_parquet` converts it with a small block and row group size
+    THEN the Parquet output has the CSV's row count and checksum, the declared
+    `column_types`, and an external source definition.
+    """
+    result = copie.copy(extra_answers={})
+    assert_generation_ok(result)
+    root: Path = result.project_dir
+    tool = _load_tool(root, monkeypatch)
+
+    # Delimiter from dbt_project.yml, column types split across it and a property file.
+    # The seed is disabled, as the README advises once it is read from Parquet.
+    seed_csv = root / "src" / "seeds" / "reference" / "products.csv"
+    _write_seed(seed_csv, delimiter="|")
+    project_yml = root / "dbt_project.yml"
+    project = yaml.safe_load(project_yml.read_text(encoding="utf-8"))
+    project["seeds"] = {
+        "dbt_project": {
+            "reference": {
+                "+enabled": False,
+                "+delimiter": "|",
+                "+column_types": {"id": "int"},
+            },
+        }
+    }
+    project_yml.write_text(yaml.safe_dump(project, sort_keys=False), encoding="utf-8")
+    (seed_csv.parent / "_reference_seeds.yml").write_text(
+        yaml.safe_dump(
+            {
+                "version": 2,
+                "seeds": [
+                    {"name": "products", "config": {"column_types": COLUMN_TYPES}}
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    exit_code = tool.main(
+        [
+            "--project-dir",
+            str(root),
+            "--location",
+            LOCATION,
+            "--block-size",
+            "4096",
+            "--row-group-size",
+            "1000",
+        ]
+    )
+    assert exit_code == 0
+
+    parquet_path = root / "target" / "seeds_parquet" / "products" / "part-00000.parquet"
+    parquet_file = pq.ParquetFile(parquet_path)
+    metadata = parquet_file.metadata
+    row_groups = [
+        metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)
+    ]
+    assert row_groups == [1000] * 5, f"Expected five 1,000-row row groups: {row_groups}"
+
+    # ---- schema honours column_types (property file overrides dbt_project.yml) ----
+    schema = parquet_file.schema_arrow
+    assert schema.field("id").type == pa.int64()
+    assert schema.field("code").type == pa.string()
+    assert schema.field("amount").type == pa.decimal128(12, 2)
+    assert schema.field("ratio").type == pa.float64()
+    assert schema.field("is_active").type == pa.bool_()
+    assert schema.field("valid_from").type == pa.date32()
+
+    # ---- row count and checksum ----
+    with seed_csv.open("r", encoding="utf-8", newline="") as f:
+        csv_rows = [
+            [_csv_text(v) for v in row]
+            for row in list(csv.reader(f, delimiter="|"))[1:]
+        ]
+    table = parquet_file.read()
+    parquet_rows = [[_as_text(v) for v in row.values()] for row in table.to_pylist()]
+
+    assert table.num_rows == len(csv_rows) == ROW_COUNT
+    assert _checksum(parquet_rows) == _checksum(csv_rows)
+
+    # Empty and `null` cells are NULL, not strings, in string and typed columns alike
+    codes = table.column("code").to_pylist()
+    assert all((code is None) == (i % 7 == 0) for i, code in enumerate(codes))
+    ratios = table.column("ratio").to_pylist()
+    assert all((ratio is None) == (i % 11 == 0) for i, ratio in enumerate(ratios))
+
+    # ---- generated source definition ----
+    sources = yaml.safe_load(
+        (root / "src" / "models" / "_seeds_sources.yml").read_text(encoding="utf-8")
+    )
+    (source,) = sources["sources"]
+    assert source["name"] == "seeds"
+    (products,) = source["tables"]
+    assert products["external"] == {
+        "location": f"{LOCATION}/products",
+        "using": "parquet",
+    }
+    assert products["columns"] == [
+        {"name": "id", "data_type": "bigint"},
+        {"name": "code", "data_type": "string"},
+        {"name": "amount", "data_type": "decimal(12,2)"},
+        {"name": "ratio", "data_type": "double"},
+        {"name": "is_active", "data_type": "boolean"},
+        {"name": "valid_from", "data_type": "date"},
+    ]
+
+
+def test_multiline_values_span_blocks(copie, assert_generation_ok, monkeypatch):
+    """Quoted values containing newlines survive being split across CSV blocks."""
+    result = copie.copy(extra_answers={})
+    assert_generation_ok(result)
+    root: Path = result.project_dir
+    tool = _load_tool(root, monkeypatch)
+
+    seed_csv = root / "src" / "seeds" / "notes.csv"
+    with seed_csv.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["note", "id"])
+        writer.writerows([f"line {i}\nmore", i] for i in range(3_000))
+
+    seed = tool.Seed(name="notes", path=seed_csv, column_types={"id": "int"})
+    conversion = tool.convert_seed(seed, root / "target", block_size=4096)
+
+    table = pq.read_table(conversion.parquet_path)
+    assert table.num_rows == 3_000
+    # Default block size reads the file in one batch; row groups are still capped
+    conversion = tool.convert_seed(seed, root / "target", row_group_size=1_000)
+    metadata = pq.ParquetFile(conversion.parquet_path).metadata
+    assert metadata.num_row_groups == 3
+    assert table.column("note").to_pylist()[2_999] == "line 2999\nmore"
+
+
+def test_select_keeps_other_tables(copie, assert_generation_ok, monkeypatch):
+    """A `--select` run updates its tables without dropping the others."""
+    result = copie.copy(extra_answers={})
+    assert_generation_ok(result)
+    root: Path = result.project_dir
+    tool = _load_tool(root, monkeypatch)
+
+    for name in ("one", "two"):
+        (root / "src" / "seeds" / f"{name}.csv").write_text(
+            "a,b\n1,2\n", encoding="utf-8"
+        )
+    assert tool.main(["--project-dir", str(root), "--location", LOCATION]) == 0
+
+    (root / "src" / "seeds" / "one.csv").write_text("a,c\n1,2\n", encoding="utf-8")
+    args = ["--project-dir", str(root), "--location", LOCATION, "--select", "one"]
+    assert tool.main(args) == 0
+
+    sources = yaml.safe_load(
+        (root / "src" / "models" / "_seeds_sources.yml").read_text(encoding="utf-8")
+    )
+    (source,) = sources["sources"]
+    tables = {t["name"]: [c["name"] for c in t["columns"]] for t in source["tables"]}
+    assert tables == {"one": ["a", "c"], "two": ["a", "b"]}
+
+
+@pytest.mark.parametrize("location", [None, "/Volumes/dev_dbt/default/seeds", "target"])
+def test_location_must_be_cloud_uri(
+    copie, assert_generation_ok, monkeypatch, capsys, location
+):
+    """Sources are never generated for a missing, volume or local location."""
+    result = copie.copy(extra_answers={})
+    assert_generation_ok(result)
+    root: Path = result.project_dir
+    tool = _load_tool(root, monkeypatch)
+    (root / "src" / "seeds" / "one.csv").write_text("a,b\n1,2\n", encoding="utf-8")
+
+    args = ["--project-dir", str(root)]
+    if location is not None:
+        args += ["--location", location]
+    with pytest.raises(SystemExit) as excinfo:
+        tool.main(args)
+
+    assert excinfo.value.code == 2
+    assert "--location" in capsys.readouterr().err
+    assert not (root / "src" / "models" / "_seeds_sources.yml").exists()
+
+
+def test_strict_requires_declared_types(copie, assert_generation_ok, monkeypatch):
+    """`--strict` fails rather than writing undeclared columns as `string`."""
+    result = copie.copy(extra_answers={})
+    assert_generation_ok(result)
+    root: Path = result.project_dir
+    tool = _load_tool(root, monkeypatch)
+
+    seed_csv = root / "src" / "seeds" / "rates.csv"
+    seed_csv.write_text("code,rate\nA,1.5\n", encoding="utf-8")
+    seed = tool.Seed(name="rates", path=seed_csv, column_types={"code": "string"})
+
+    with pytest.raises(ValueError, match=r"no column_types for columns: \['rate'\]"):
+        tool.seed_schema(seed, strict=True)
+    args = ["--project-dir", str(root), "--location", LOCATION, "--strict"]
+    assert tool.main(args) == 1
+    assert tool.seed_schema(seed).field("rate").type == pa.string()
+
+
+def test_zoned_timestamps_and_decimal_rounding(
+    copie, assert_generation_ok, monkeypatch
+):
+    """Offsets convert to UTC and extra fractional digits round, as in the warehouse."""
+    result = copie.copy(extra_answers={})
+    assert_generation_ok(result)
+    root: Path = result.project_dir
+    tool = _load_tool(root, monkeypatch)
+
+    seed_csv = root / "src" / "seeds" / "events.csv"
+    seed_csv.write_text(
+        "at,amount,balance\n"
+        "2024-01-01T10:00:00+02:00,1.005,1.005\n"
+        "2024-01-01 10:00:00,-2.345,-2.345\n"
+        f",3,{'9' * 35}.995\n",
+        encoding="utf-8",
+    )
+    seed = tool.Seed(
+        name="events",
+        path=seed_csv,
+        column_types={
+            "at": "timestamp",
+            "amount": "decimal(5,2)",
+            "balance": "decimal(38,2)",
+        },
+    )
+    conversion = tool.convert_seed(seed, root / "target")
+    table = pq.read_table(conversion.parquet_path)
+
+    utc = dt.UTC
+    assert table.column("at").to_pylist() == [
+        dt.datetime(2024, 1, 1, 8, tzinfo=utc),
+        dt.datetime(2024, 1, 1, 10, tzinfo=utc),
+        None,
+    ]
+    assert table.column("amount").to_pylist() == [
+        Decimal("1.01"),
+        Decimal("-2.35"),
+        Decimal("3.00"),
+    ]
+    # Full-precision decimals round too, carrying into the integer digits
+    assert table.column("balance").to_pylist() == [
+        Decimal("1.01"),
+        Decimal("-2.35"),
+        Decimal(f"1{'0' * 35}.00"),
+    ]
+
+    seed_csv.write_text("at,amount,balance\n,12345.6,0\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="'events' column 'amount'.*decimal\\(5,2\\)"):
+        tool.convert_seed(seed, root / "target")
+
+
+def test_unsupported_column_type(copie, assert_generation_ok, monkeypatch):
+    result = copie.copy(extra_answers={})
+    assert_generation_ok(result)
+    tool = _load_tool(result.project_dir, monkeypatch)
+
+    with pytest.raises(ValueError, match="Unsupported seed column type"):
+        tool.to_arrow_type("map<string,int>")
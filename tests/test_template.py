@@ -17,6 +17,7 @@ def test_template_configurations(
         with_utils,
         with_artifacts,
         with_expectations,
+        with_external_tables,
         with_automate_dv,
     ) = template_scenario
 
@@ -30,6 +31,7 @@ def test_template_configurations(
         with_utils=with_utils,
         with_artifacts=with_artifacts,
         with_expectations=with_expectations,
+        with_external_tables=with_external_tables,
         with_automate_dv=with_automate_dv,
     )
 
@@ -38,6 +40,7 @@ def test_template_configurations(
         with_utils=with_utils,
         with_artifacts=with_artifacts,
         with_expectations=with_expectations,
+        with_external_tables=with_external_tables,
         with_automate_dv=with_automate_dv,
     )
 